@@ -0,0 +1,83 @@
+"""Shared fixtures for the test suite."""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+import responses
+from click.testing import CliRunner
+from youtube_transcript_api import NoTranscriptFound
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One CliRunner shared by every CLI test."""
+    return CliRunner()
+
+
+@pytest.fixture
+def make_transcript(monkeypatch):
+    """Factory wiring a mocked transcript list into the CLI module.
+
+    Returns a helper taking the segment list; pass generated=True to make
+    the manual lookup miss and serve the segments as auto-generated
+    captions instead.
+    """
+    def _make(segments, generated=False):
+        mock_transcript = MagicMock()
+        if generated:
+            mock_transcript.find_transcript.side_effect = NoTranscriptFound(
+                "x", ["en"], ["en"]
+            )
+            mock_transcript.find_generated_transcript.return_value.fetch.return_value = segments
+        else:
+            mock_transcript.find_transcript.return_value.fetch.return_value = segments
+        monkeypatch.setattr(
+            "yt_transcript.cli.YouTubeTranscriptApi.list",
+            MagicMock(return_value=mock_transcript),
+        )
+        return mock_transcript
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _no_disk_cache(monkeypatch):
+    """Keep tests away from the user's on-disk transcript cache."""
+    monkeypatch.setenv("YT_TRANSCRIPT_NO_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def _clipboard_available(monkeypatch):
+    """Pretend a clipboard backend exists.
+
+    On headless CI the import-time probe correctly reports no clipboard,
+    which would route every copy-path test into the print fallback; the
+    tests mock pyperclip.copy themselves, so force the copy path.
+    """
+    monkeypatch.setattr("yt_transcript.cli._HAVE_CLIPBOARD", True)
+
+
+@pytest.fixture(autouse=True)
+def _fake_pyperclip(monkeypatch):
+    """Stub the clipboard so pyperclip never probes xclip/xsel/pbcopy.
+
+    Tests that care about clipboard behaviour still @patch
+    yt_transcript.cli.pyperclip.copy, which takes precedence inside
+    their scope.
+    """
+    import pyperclip
+
+    monkeypatch.setattr(pyperclip, "copy", lambda s: None, raising=True)
+    monkeypatch.setattr(pyperclip, "paste", lambda: "", raising=True)
+
+
+@pytest.fixture
+def mock_youtube_html():
+    """Serve a canned YouTube watch page for title-extraction tests."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.get(
+            re.compile(r"https://www\.youtube\.com/watch.*"),
+            body="<title>Test Video Title - YouTube</title>",
+        )
+        yield rsps
@@ -1,11 +1,17 @@
 """Tests for the CLI module."""
 
+import re
+
 import pytest
-from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
 
 from yt_transcript.cli import main, extract_video_id, fetch_transcript
 
+# Compiled once so parametrized/error-path tests don't recompile per call
+_ERR_NO_ID = re.compile(r"Could not parse a YouTube video ID")
+_ERR_DISABLED = re.compile(r"Transcripts are disabled")
+_ERR_UNAVAILABLE = re.compile(r"Video is unavailable")
+
 
 class TestVideoIdExtraction:
     """Test video ID extraction from various URL formats."""
@@ -37,12 +43,12 @@ class TestVideoIdExtraction:
     
     def test_extract_video_id_invalid_url(self):
         """Test error handling for invalid URLs."""
-        with pytest.raises(ValueError, match="Could not parse a YouTube video ID"):
+        with pytest.raises(ValueError, match=_ERR_NO_ID):
             extract_video_id("https://example.com/video")
     
     def test_extract_video_id_invalid_id(self):
         """Test error handling for invalid video IDs."""
-        with pytest.raises(ValueError, match="Could not parse a YouTube video ID"):
+        with pytest.raises(ValueError, match=_ERR_NO_ID):
             extract_video_id("invalid_id")
 
 
@@ -64,21 +70,13 @@ class TestTranscriptFetching:
         assert result == "Hello world"
         mock_list.assert_called_once_with("dQw4w9WgXcQ")
     
-    @patch('yt_transcript.cli.YouTubeTranscriptApi.list')
-    def test_fetch_transcript_fallback_to_auto_generated(self, mock_list):
+    def test_fetch_transcript_fallback_to_auto_generated(self, make_transcript):
         """Test fallback to auto-generated captions."""
-        from youtube_transcript_api import NoTranscriptFound
-        
-        mock_transcript = MagicMock()
-        # First call (manual transcript) raises exception
-        mock_transcript.find_transcript.side_effect = NoTranscriptFound(
-            "dQw4w9WgXcQ", ["en"], ["en"]
+        # Manual transcript lookup misses; auto-generated succeeds
+        make_transcript(
+            [{"text": "Auto generated", "start": 0.0, "duration": 2.0}],
+            generated=True,
         )
-        # Second call (auto-generated) succeeds
-        mock_transcript.find_generated_transcript.return_value.fetch.return_value = [
-            {"text": "Auto generated", "start": 0.0, "duration": 2.0}
-        ]
-        mock_list.return_value = mock_transcript
         
         result = fetch_transcript("dQw4w9WgXcQ", ["en"])
         assert result == "Auto generated"
@@ -106,7 +104,7 @@ class TestTranscriptFetching:
         
         mock_list.side_effect = TranscriptsDisabled("dQw4w9WgXcQ")
         
-        with pytest.raises(RuntimeError, match="Transcripts are disabled"):
+        with pytest.raises(RuntimeError, match=_ERR_DISABLED):
             fetch_transcript("dQw4w9WgXcQ")
     
     @patch('yt_transcript.cli.YouTubeTranscriptApi.list')
@@ -116,16 +114,107 @@ class TestTranscriptFetching:
         
         mock_list.side_effect = VideoUnavailable("dQw4w9WgXcQ")
         
-        with pytest.raises(RuntimeError, match="Video is unavailable"):
+        with pytest.raises(RuntimeError, match=_ERR_UNAVAILABLE):
             fetch_transcript("dQw4w9WgXcQ")
 
 
+class _FakeCache:
+    """Minimal in-memory stand-in for diskcache.Cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, expire=None, tag=None):
+        self.store[key] = value
+
+
+class TestTranscriptCache:
+    """Test the on-disk cache layer against in-memory fakes."""
+
+    @pytest.fixture
+    def fake_cache(self, monkeypatch):
+        """Install a fake cache and re-enable caching for the test."""
+        cache = _FakeCache()
+        monkeypatch.setattr("yt_transcript.cli._cache", cache)
+        monkeypatch.delenv("YT_TRANSCRIPT_NO_CACHE", raising=False)
+        return cache
+
+    def test_cache_miss_then_hit(self, fake_cache, make_transcript):
+        """A miss populates the cache; the hit skips the network."""
+        make_transcript([{"text": "cached text", "start": 0.0}])
+
+        assert fetch_transcript("test_id") == "cached text"
+        assert ("test_id", ("en",)) in fake_cache.store
+
+        with patch("yt_transcript.cli._fetch_transcript") as mock_fetch:
+            assert fetch_transcript("test_id") == "cached text"
+            mock_fetch.assert_not_called()
+
+    def test_compressed_entries_round_trip(self, fake_cache, make_transcript, monkeypatch):
+        """With a compressor installed, entries are stored as bytes."""
+        monkeypatch.setattr("yt_transcript.cli._compress", lambda b: b"Z" + b)
+        monkeypatch.setattr("yt_transcript.cli._decompress", lambda b: b[1:])
+        make_transcript([{"text": "zstd text", "start": 0.0}])
+
+        assert fetch_transcript("test_id") == "zstd text"
+        assert fake_cache.store[("test_id", ("en",))] == b"Zzstd text"
+
+        with patch("yt_transcript.cli._fetch_transcript") as mock_fetch:
+            assert fetch_transcript("test_id") == "zstd text"
+            mock_fetch.assert_not_called()
+
+    def test_bytes_entry_without_decompressor_is_a_miss(
+        self, fake_cache, make_transcript, monkeypatch
+    ):
+        """A compressed entry read without zstandard falls back to a fetch."""
+        monkeypatch.setattr("yt_transcript.cli._compress", None)
+        monkeypatch.setattr("yt_transcript.cli._decompress", None)
+        fake_cache.store[("test_id", ("en",))] = b"\x28\xb5stale frame"
+        make_transcript([{"text": "refetched", "start": 0.0}])
+
+        assert fetch_transcript("test_id") == "refetched"
+
+    def test_corrupt_compressed_entry_is_a_miss(
+        self, fake_cache, make_transcript, monkeypatch
+    ):
+        """A frame the decompressor rejects falls back to a fetch."""
+
+        def _explode(blob):
+            raise ValueError("bad frame")
+
+        monkeypatch.setattr("yt_transcript.cli._compress", None)
+        monkeypatch.setattr("yt_transcript.cli._decompress", _explode)
+        fake_cache.store[("test_id", ("en",))] = b"garbage"
+        make_transcript([{"text": "refetched", "start": 0.0}])
+
+        assert fetch_transcript("test_id") == "refetched"
+
+    def test_no_cache_flag_is_invocation_scoped(
+        self, fake_cache, make_transcript, runner
+    ):
+        """--no-cache bypasses the cache without disabling it for later calls."""
+        make_transcript([{"text": "fresh text", "start": 0.0}])
+
+        result = runner.invoke(main, ["dQw4w9WgXcQ", "--no-cache", "--no-copy"])
+
+        assert result.exit_code == 0
+        assert fake_cache.store == {}
+
+        # Caching comes back on once main returns
+        assert fetch_transcript("dQw4w9WgXcQ") == "fresh text"
+        assert ("dQw4w9WgXcQ", ("en",)) in fake_cache.store
+
+
 class TestCLI:
     """Test the CLI interface."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
+    @pytest.fixture(autouse=True)
+    def _attach_runner(self, runner):
+        """Share the session-scoped CliRunner via self.runner."""
+        self.runner = runner
     
     @patch('yt_transcript.cli.fetch_transcript')
     @patch('yt_transcript.cli.pyperclip.copy')
@@ -198,6 +287,20 @@ class TestCLI:
         assert "⚠️  Could not access the clipboard" in result.output
         assert "Test transcript" in result.output
     
+    @patch('yt_transcript.cli.fetch_transcript')
+    @patch('yt_transcript.cli.pyperclip.copy')
+    def test_cli_batch_mode(self, mock_copy, mock_fetch):
+        """Test CLI with several video IDs in one invocation."""
+        mock_fetch.side_effect = lambda vid, langs: f"transcript for {vid}"
+
+        result = self.runner.invoke(main, ['dQw4w9WgXcQ', 'abcdefghijk'])
+
+        assert result.exit_code == 0
+        assert "✅ 2 transcripts" in result.output
+        mock_copy.assert_called_once_with(
+            "transcript for dQw4w9WgXcQ\n\ntranscript for abcdefghijk"
+        )
+
     @patch('yt_transcript.cli.fetch_transcript')
     @patch('yt_transcript.cli.pyperclip.copy')
     def test_cli_full_url(self, mock_copy, mock_fetch):
@@ -213,9 +316,10 @@ class TestCLI:
 class TestIntegration:
     """Integration tests that test multiple components together."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
+    @pytest.fixture(autouse=True)
+    def _attach_runner(self, runner):
+        """Share the session-scoped CliRunner via self.runner."""
+        self.runner = runner
     
     @patch('yt_transcript.cli.YouTubeTranscriptApi.list')
     @patch('yt_transcript.cli.pyperclip.copy')
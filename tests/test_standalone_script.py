@@ -1,12 +1,25 @@
 """Tests for the standalone yt-transcript script."""
 
+import importlib.machinery
+import importlib.util
 import pytest
-import subprocess
-import sys
 import os
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
+SCRIPT_PATH = Path(__file__).parent.parent / "yt-transcript"
+
+
+@pytest.fixture(scope="session")
+def yt_script_module():
+    """Load the hyphen-named standalone script as a real module, once per session."""
+    os.environ.setdefault("YT_TRANSCRIPT_NO_CACHE", "1")
+    loader = importlib.machinery.SourceFileLoader("yt_transcript_script", str(SCRIPT_PATH))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
 
 class TestStandaloneScript:
     """Test the standalone yt-transcript script."""
@@ -21,66 +34,29 @@ class TestStandaloneScript:
         assert self.script_path.exists(), f"Script not found at {self.script_path}"
         assert os.access(self.script_path, os.X_OK), "Script is not executable"
     
-    def test_script_usage_message(self):
+    def test_script_usage_message(self, yt_script_module, capsys):
         """Test script shows usage when called without arguments."""
-        result = subprocess.run(
-            [sys.executable, str(self.script_path)],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 1
-        assert "Usage: yt-transcript <youtube_url>" in result.stdout
-    
-    def test_script_invalid_video_id(self):
+        with pytest.raises(SystemExit) as exc_info:
+            yt_script_module.main([])
+        assert exc_info.value.code == 1
+        assert "Usage: yt-transcript <youtube_url>" in capsys.readouterr().out
+
+    def test_script_invalid_video_id(self, yt_script_module, capsys):
         """Test script error handling for invalid video IDs."""
-        result = subprocess.run(
-            [sys.executable, str(self.script_path), "invalid_url"],
-            capture_output=True,
-            text=True
-        )
-        assert result.returncode == 1
-        assert "❌ Could not extract video ID" in result.stdout
+        with pytest.raises(SystemExit) as exc_info:
+            yt_script_module.main(["invalid_url"])
+        assert exc_info.value.code == 1
+        assert "❌ Could not extract video ID" in capsys.readouterr().out
     
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test_key'})
-    @patch('requests.get')
-    def test_script_video_title_extraction(self, mock_get):
+    def test_script_video_title_extraction(self, yt_script_module, mock_youtube_html):
         """Test video title extraction functionality."""
-        # Mock HTML response with title
-        mock_response = MagicMock()
-        mock_response.text = '<title>Test Video Title - YouTube</title>'
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        # Import the functions directly to test them
-        import sys
-        sys.path.insert(0, str(self.script_path.parent))
-        
-        # Read and execute the script to get access to functions
-        with open(self.script_path, 'r') as f:
-            script_content = f.read()
-        
-        # Create a namespace to execute the script in
-        script_globals = {}
-        exec(script_content, script_globals)
-        
-        # Test the get_video_title function
-        title = script_globals['get_video_title']('dQw4w9WgXcQ')
+        title = yt_script_module.get_video_title('dQw4w9WgXcQ')
         assert title == "Test Video Title"
     
-    def test_script_video_id_extraction(self):
+    def test_script_video_id_extraction(self, yt_script_module):
         """Test video ID extraction from the standalone script."""
-        import sys
-        sys.path.insert(0, str(self.script_path.parent))
-        
-        # Read and execute the script to get access to functions
-        with open(self.script_path, 'r') as f:
-            script_content = f.read()
-        
-        script_globals = {}
-        exec(script_content, script_globals)
-        
-        # Test the extract_video_id function
-        extract_video_id = script_globals['extract_video_id']
+        extract_video_id = yt_script_module.extract_video_id
         
         # Test various URL formats
         assert extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
@@ -90,57 +66,42 @@ class TestStandaloneScript:
 
 class TestScriptIntegration:
     """Integration tests for the standalone script."""
-    
-    @property
-    def script_path(self):
-        """Get the path to the standalone script."""
-        return Path(__file__).parent.parent / "yt-transcript"
-    
-    @patch.dict(os.environ, {}, clear=True)
-    def test_script_without_api_key(self):
-        """Test script behavior when GEMINI_API_KEY is not set."""
-        # This test checks that the script can still extract transcripts
-        # even without the API key (it just won't get AI summaries)
-        result = subprocess.run(
-            [sys.executable, str(self.script_path), "dQw4w9WgXcQ"],
-            capture_output=True,
-            text=True,
-            timeout=10  # Don't let it hang
+
+    @pytest.fixture
+    def fake_network(self, monkeypatch, yt_script_module):
+        """Stub the title/transcript/clipboard calls so main() runs offline."""
+        monkeypatch.setattr(yt_script_module, "get_video_title", lambda vid: "Test Video")
+        monkeypatch.setattr(
+            yt_script_module, "get_transcript_text", lambda vid: "some transcript text"
         )
-        # Should fail at transcript extraction, not at API key check
-        assert "GEMINI_API_KEY environment variable not found" in result.stdout
-    
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test_key'})
-    def test_script_with_api_key_set(self):
+        monkeypatch.setattr(yt_script_module.pyperclip, "copy", lambda s: None)
+
+    def test_script_without_api_key(self, yt_script_module, fake_network, monkeypatch, capsys):
+        """Test script behavior when GEMINI_API_KEY is not set."""
+        # The script should still extract transcripts even without the
+        # API key (it just won't get AI summaries)
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        yt_script_module.main(["https://youtu.be/dQw4w9WgXcQ"])
+        # Should fall back to the raw transcript, not die at the API key check
+        assert "GEMINI_API_KEY environment variable not found" in capsys.readouterr().out
+
+    def test_script_with_api_key_set(self, yt_script_module, fake_network, monkeypatch, capsys):
         """Test that script accepts API key from environment."""
-        # Just test that it gets past the API key check
-        result = subprocess.run(
-            [sys.executable, str(self.script_path), "dQw4w9WgXcQ"],
-            capture_output=True,
-            text=True,
-            timeout=10
+        monkeypatch.setenv("GEMINI_API_KEY", "test_key")
+        monkeypatch.setattr(
+            yt_script_module, "get_gemini_summary", lambda title, transcript: "summary"
         )
-        # Should fail at transcript fetching, not API key validation
-        assert "GEMINI_API_KEY environment variable not found" not in result.stdout
+        yt_script_module.main(["https://youtu.be/dQw4w9WgXcQ"])
+        # Should get past the API key check without complaint
+        assert "GEMINI_API_KEY environment variable not found" not in capsys.readouterr().out
 
 
 class TestScriptFunctions:
     """Test individual functions from the standalone script by importing them."""
     
-    @classmethod
-    def setup_class(cls):
-        """Set up the class by importing the script functions."""
-        script_path = Path(__file__).parent.parent / "yt-transcript"
-        
-        with open(script_path, 'r') as f:
-            script_content = f.read()
-        
-        cls.script_globals = {}
-        exec(script_content, cls.script_globals)
-    
-    def test_extract_video_id_function(self):
+    def test_extract_video_id_function(self, yt_script_module):
         """Test the extract_video_id function directly."""
-        extract_video_id = self.script_globals['extract_video_id']
+        extract_video_id = yt_script_module.extract_video_id
         
         # Test valid URLs
         assert extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
@@ -150,31 +111,31 @@ class TestScriptFunctions:
         assert extract_video_id("https://example.com") is None
         assert extract_video_id("invalid") is None
     
-    @patch('requests.get')
-    def test_get_video_title_function(self, mock_get):
+    def test_get_video_title_function(self, yt_script_module, mock_youtube_html):
         """Test the get_video_title function directly."""
-        get_video_title = self.script_globals['get_video_title']
-        
-        # Test successful title extraction
-        mock_response = MagicMock()
-        mock_response.text = '<title>Amazing Video - YouTube</title>'
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
-        title = get_video_title('dQw4w9WgXcQ')
-        assert title == "Amazing Video"
-        
-        # Test with network error
-        mock_get.side_effect = Exception("Network error")
+        get_video_title = yt_script_module.get_video_title
+
         title = get_video_title('dQw4w9WgXcQ')
+        assert title == "Test Video Title"
+
+    def test_get_video_title_network_error(self, yt_script_module):
+        """Test get_video_title falls back to a placeholder on network errors."""
+        import responses
+
+        with responses.RequestsMock() as rsps:
+            rsps.get(
+                "https://www.youtube.com/watch",
+                body=ConnectionError("Network error"),
+            )
+            title = yt_script_module.get_video_title('dQw4w9WgXcQ')
         assert title == "YouTube Video dQw4w9WgXcQ"
     
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test_key'})
     @patch('google.generativeai.configure')
     @patch('google.generativeai.GenerativeModel')
-    def test_get_gemini_summary_function(self, mock_model_class, mock_configure):
+    def test_get_gemini_summary_function(self, mock_model_class, mock_configure, yt_script_module):
         """Test the get_gemini_summary function directly."""
-        get_gemini_summary = self.script_globals['get_gemini_summary']
+        get_gemini_summary = yt_script_module.get_gemini_summary
         
         # Mock the Gemini model
         mock_model = MagicMock()
@@ -191,9 +152,9 @@ class TestScriptFunctions:
         mock_model.generate_content.assert_called_once()
     
     @patch.dict(os.environ, {}, clear=True)  # Clear GEMINI_API_KEY
-    def test_get_gemini_summary_no_api_key(self):
+    def test_get_gemini_summary_no_api_key(self, yt_script_module):
         """Test get_gemini_summary when API key is missing."""
-        get_gemini_summary = self.script_globals['get_gemini_summary']
+        get_gemini_summary = yt_script_module.get_gemini_summary
         
         title = "Test Title"
         transcript = "Test transcript"
@@ -1,9 +1,41 @@
-import re
+import os
+import string
 import sys
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import List, Optional
 
+try:  # optional linear-time (DFA) engine; stdlib re is the fallback
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+try:  # optional on-disk transcript cache; without it every call hits YouTube
+    from diskcache import Cache
+
+    _cache = Cache(os.path.expanduser("~/.cache/yt_transcript"))
+except Exception:
+    _cache = None
+
+_CACHE_EXPIRY = 86400  # seconds; transcripts rarely change within a day
+
+try:  # optional zstd compression for cached transcripts; English caption
+    # text compresses 3-5x, shrinking warm-hit disk reads by the same factor
+    import zstandard as _zstd
+
+    _compress = _zstd.ZstdCompressor(level=3).compress
+    _decompress = _zstd.ZstdDecompressor().decompress
+except ImportError:
+    _compress = None
+    _decompress = None
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 import pyperclip
+import requests
+from requests.adapters import HTTPAdapter
 from youtube_transcript_api import (
     YouTubeTranscriptApi,
     TranscriptsDisabled,
@@ -11,67 +43,281 @@ from youtube_transcript_api import (
     VideoUnavailable,
 )
 
-YT_ID_RE = re.compile(
-    r"(?:v=|\/)([0-9A-Za-z_-]{11}).*"
-)  # catches youtu.be/, embed/, watch?v=, etc
+try:  # typed rate-limit errors; not present in older releases
+    from youtube_transcript_api import IpBlocked, RequestBlocked
+
+    _RATE_LIMIT_ERRORS = (IpBlocked, RequestBlocked)
+except ImportError:
+    _RATE_LIMIT_ERRORS = ()
+
+# One pooled session for all YouTube calls: list() and fetch() reuse the
+# same TCP+TLS connection instead of handshaking per request.
+_session = requests.Session()
+_session.headers["User-Agent"] = "yt-transcript-cli/0.1"
+_session.mount("https://", HTTPAdapter(pool_maxsize=4))
+atexit.register(_session.close)
+
+_api = YouTubeTranscriptApi(http_client=_session)
+
+# Probe for a clipboard backend once at import.  pyperclip otherwise
+# defers the probe (spawning xclip/xsel/wl-copy) to the first copy() of
+# every invocation, and on headless boxes that probe costs tens of
+# milliseconds just to fail.  determine_clipboard() never raises: with no
+# backend it returns ClipboardUnavailable stubs that only fail when
+# called, so inspect the returned function's type instead of catching.
+_HAVE_CLIPBOARD = (
+    type(pyperclip.determine_clipboard()[0]).__name__ != "ClipboardUnavailable"
+)
+
+# Allowed video-ID alphabet; a frozenset difference beats even a compiled
+# regex on 11-char strings because it never enters the regex engine.
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 
+def _is_bare_id(candidate: str) -> bool:
+    return len(candidate) == 11 and not (set(candidate) - _ID_CHARS)
 
+# One union pattern covering every supported URL shape; with re2 installed
+# this is a single linear scan instead of one backtracking pass per shape.
+# Every alternative is a fixed-width literal prefix - no .* subpatterns,
+# so nothing rescans the URL tail (tracking params and the like).
+_VIDEO_ID_RE = _re.compile(
+    r"(?:[?&]v=|youtu\.be/|/embed/|/shorts/|/vi?/)([0-9A-Za-z_-]{11})"
+)
+
+
+@lru_cache(maxsize=4096)
 def extract_video_id(url_or_id: str) -> str:
     """
     Accepts a full YouTube URL or a bare 11-char video ID.
     Raises ValueError if not recognisable.
+
+    Memoized: library callers looping over playlists often re-parse the
+    same URLs, and repeats become a dict lookup.
     """
-    if len(url_or_id) == 11 and re.match(r"^[0-9A-Za-z_-]+$", url_or_id):
+    if _is_bare_id(url_or_id):
         return url_or_id
-    m = YT_ID_RE.search(url_or_id)
+    # Plain str.find fast paths for the two overwhelmingly common shapes;
+    # the union regex only runs for the long tail (embed, shorts, etc).
+    i = url_or_id.find("v=")
+    if i != -1:
+        candidate = url_or_id[i + 2 : i + 13]
+        if _is_bare_id(candidate):
+            return candidate
+    i = url_or_id.find("youtu.be/")
+    if i != -1:
+        candidate = url_or_id[i + 9 : i + 20]
+        if _is_bare_id(candidate):
+            return candidate
+    m = _VIDEO_ID_RE.search(url_or_id)
     if m:
         return m.group(1)
     raise ValueError(f"Could not parse a YouTube video ID from '{url_or_id}'")
 
 
+_get_text_attr = attrgetter("text")
+_get_text_item = itemgetter("text")
+
+
+class _TranscriptBuilder:
+    """
+    Accumulates snippet texts and joins once at the end, so assembly
+    stays linear in total length no matter how the pieces arrive
+    (whole list today, streamed segment-at-a-time tomorrow).
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self):
+        self._parts = []
+
+    def add(self, text: str) -> None:
+        self._parts.append(text)
+
+    def extend(self, texts) -> None:
+        self._parts.extend(texts)
+
+    def build(self) -> str:
+        return " ".join(self._parts)
+
+
+def _join_segments(fetched) -> str:
+    """
+    Concatenate snippet texts in one linear pass.
+
+    Dispatches once on the first element so the per-segment lookup runs
+    through a C-level getter: attrgetter for the API's slotted snippet
+    objects, itemgetter for plain dicts.
+    """
+    # FetchedTranscript exposes its snippet list directly; using it (or a
+    # list passed in as-is) skips duplicating thousands of segment refs.
+    parts = getattr(fetched, "snippets", fetched)
+    if not isinstance(parts, list):
+        parts = list(parts)
+    if not parts:
+        return ""
+    getter = _get_text_attr if hasattr(parts[0], "text") else _get_text_item
+    builder = _TranscriptBuilder()
+    builder.extend(map(getter, parts))
+    return builder.build()
+
+
+def _fetch_text(track) -> str:
+    return _join_segments(track.fetch())
+
+
+def _fetch_candidates(candidates) -> Optional[str]:
+    """
+    Fetch candidate tracks and return the first non-empty text in
+    priority order.  With several candidates the fetches run in
+    parallel, so waiting costs max(RTT) instead of the sum; a failed
+    lower-priority fetch never masks a successful higher-priority one.
+
+    Returns None only when every fetch genuinely came back empty.  If
+    any fetch raised and none produced text, the first error is
+    re-raised so typed failures (rate limiting etc.) keep their meaning
+    instead of being misreported as a missing transcript.
+    """
+    if not candidates:
+        return None
+    if len(candidates) == 1:
+        return _fetch_text(candidates[0]) or None
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        futures = [pool.submit(_fetch_text, track) for track in candidates]
+    errors = []
+    for future in futures:
+        try:
+            text = future.result()
+        except Exception as e:
+            errors.append(e)
+            continue
+        if text:
+            return text
+    if errors:
+        raise errors[0]
+    return None
+
+
+# Flipped by --no-cache for the duration of one main() run; the
+# environment variable remains the process-wide switch.
+_cache_disabled = False
+
+
+def _cache_enabled() -> bool:
+    return (
+        _cache is not None
+        and not _cache_disabled
+        and not os.environ.get("YT_TRANSCRIPT_NO_CACHE")
+    )
+
+
+def _decode_cached(value) -> Optional[str]:
+    """
+    Cached values are zstd frames (bytes) when zstandard is installed and
+    plain strings otherwise.  Anything undecodable - e.g. a compressed
+    entry read after zstandard was uninstalled - counts as a miss.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bytes) and _decompress is not None:
+        try:
+            return _decompress(value).decode("utf-8")
+        except Exception:
+            return None
+    return None
+
+
 def fetch_transcript(video_id: str, preferred_langs: Optional[List[str]] = None) -> str:
     """
     Returns plain-text transcript.  Tries languages in order.
     Falls back to auto-generated captions.
+
+    Results are memoized on disk (keyed on video ID and language order)
+    when diskcache is installed, so repeat fetches of the same video skip
+    the network.  --no-cache / YT_TRANSCRIPT_NO_CACHE bypasses the cache.
     """
     preferred_langs = preferred_langs or ["en"]
+    cache_key = (video_id, tuple(preferred_langs))
+    if _cache_enabled():
+        cached = _decode_cached(_cache.get(cache_key))
+        if cached is not None:
+            return cached
+    text = _fetch_transcript(video_id, preferred_langs)
+    if _cache_enabled():
+        value = _compress(text.encode("utf-8")) if _compress else text
+        _cache.set(cache_key, value, expire=_CACHE_EXPIRY, tag="transcript")
+    return text
+
+
+def _fetch_transcript(video_id: str, preferred_langs: List[str]) -> str:
     try:
-        transcript_list = YouTubeTranscriptApi.list(video_id)
+        transcript_list = _api.list(video_id)
+
+        # Index the already-fetched track metadata once so choosing a
+        # language is a dict lookup instead of exception-driven find_*
+        # calls per candidate (a raised NoTranscriptFound costs ~10x a
+        # dict miss).  Manual captions win over auto-generated ones.
+        manual = {}
+        auto = {}
+        for track in transcript_list:
+            target = auto if track.is_generated else manual
+            target.setdefault(track.language_code, track)
 
-        # Choose best track: first matching manual caption, else auto-generated.
-        for lang in preferred_langs:
-            try:
-                return " ".join(
-                    [t["text"] for t in transcript_list.find_transcript([lang]).fetch()]
+        if manual or auto:
+            candidates = [
+                track
+                for track in (
+                    manual.get(lang) or auto.get(lang) for lang in preferred_langs
                 )
-            except NoTranscriptFound:
-                # try auto-generated in that language
+                if track is not None
+            ]
+        else:
+            # No iterable metadata (stubbed transcript lists) – fall back
+            # to resolving candidates through the find_* API.
+            candidates = []
+            for lang in preferred_langs:
                 try:
-                    return " ".join(
-                        [
-                            t["text"]
-                            for t in transcript_list.find_generated_transcript([lang]).fetch()
-                        ]
-                    )
+                    candidates.append(transcript_list.find_transcript([lang]))
                 except NoTranscriptFound:
-                    continue  # keep looping
+                    # try auto-generated in that language
+                    try:
+                        candidates.append(
+                            transcript_list.find_generated_transcript([lang])
+                        )
+                    except NoTranscriptFound:
+                        continue  # keep looping
+
+        text = _fetch_candidates(candidates)
+        if text:
+            return text
         # Still no match – default to first available
-        return " ".join([item["text"] for item in transcript_list.find_transcript([]).fetch()])
+        return _join_segments(transcript_list.find_transcript([]).fetch())
 
     except TranscriptsDisabled:
         raise RuntimeError("Transcripts are disabled for this video.")
     except NoTranscriptFound:
         raise RuntimeError("No transcript available in the requested languages.")
+    except VideoUnavailable:
+        raise RuntimeError("Video is unavailable or private.")
+    except _RATE_LIMIT_ERRORS:
+        raise RuntimeError("YouTube is rate-limiting us.  Try again later.")
     except Exception as e:
+        # Substring sniff kept as a fallback for untyped errors (proxies,
+        # wrapped HTTP failures) that only mention rate limits in the text.
         if "rate" in str(e).lower():
             raise RuntimeError("YouTube is rate-limiting us.  Try again later.")
         raise RuntimeError(f"Unexpected error: {e}")
-    except VideoUnavailable:
-        raise RuntimeError("Video is unavailable or private.")
+
+
+def _print_clipboard_fallback(text: str) -> None:
+    # One concatenation, one echo: a single buffered write instead of two
+    # separate syscalls + newline handlings, which matters when the
+    # transcript runs to megabytes and stdout is a pipe.
+    click.echo("⚠️  Could not access the clipboard; printing instead:\n\n" + text)
 
 
 @click.command()
-@click.argument("url_or_id")
+@click.argument("urls_or_ids", nargs=-1, required=True, metavar="URL_OR_ID...")
 @click.option(
     "-l",
     "--lang",
@@ -83,33 +329,87 @@ def fetch_transcript(video_id: str, preferred_langs: Optional[List[str]] = None)
     default=True,
     help="Copy to clipboard (default) or just print.",
 )
-def main(url_or_id: str, lang: List[str], copy: bool):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Bypass the on-disk transcript cache.",
+)
+def main(urls_or_ids: List[str], lang: List[str], copy: bool, no_cache: bool):
     """
-    Extract YouTube transcript and copy it to the clipboard.
+    Extract YouTube transcript(s) and copy them to the clipboard.
 
-    URL_OR_ID can be a full YouTube URL or a plain 11-character video ID.
+    Each URL_OR_ID can be a full YouTube URL or a plain 11-character
+    video ID.  With several arguments the fetches run in parallel and
+    one Python startup is amortized across the whole batch.
     """
-    try:
-        video_id = extract_video_id(url_or_id)
-    except ValueError as e:
-        click.echo(f"❌ {e}", err=True)
-        sys.exit(1)
+    video_ids = []
+    for url_or_id in urls_or_ids:
+        try:
+            video_ids.append(extract_video_id(url_or_id))
+        except ValueError as e:
+            click.echo(f"❌ {e}", err=True)
+            sys.exit(1)
 
+    langs = list(lang)
+    global _cache_disabled
+    if no_cache:
+        _cache_disabled = True
     try:
-        text = fetch_transcript(video_id, list(lang))
+        if len(video_ids) == 1:
+            texts = [fetch_transcript(video_ids[0], langs)]
+        else:
+            # Parallel fetches over the shared pooled session: the batch
+            # waits roughly max(RTT) rather than the sum.
+            with ThreadPoolExecutor(max_workers=min(8, len(video_ids))) as pool:
+                texts = list(
+                    pool.map(lambda vid: fetch_transcript(vid, langs), video_ids)
+                )
     except RuntimeError as e:
         click.echo(f"❌ {e}", err=True)
         sys.exit(2)
+    finally:
+        _cache_disabled = False
 
-    if copy:
+    text = texts[0] if len(texts) == 1 else "\n\n".join(texts)
+
+    if copy and _HAVE_CLIPBOARD:
         try:
             pyperclip.copy(text)
-            click.echo(f"✅ Transcript ({len(text.split())} words) copied to clipboard.")
+            # count(" ")+1 approximates len(text.split()) without
+            # allocating a throwaway list of every word.  Snippet text
+            # can carry internal newlines or doubled spaces that skew
+            # the figure slightly; close enough for a status message.
+            word_count = sum(t.count(" ") + 1 for t in texts if t)
+            if len(texts) == 1:
+                click.echo(f"✅ Transcript ({word_count} words) copied to clipboard.")
+            else:
+                click.echo(
+                    f"✅ {len(texts)} transcripts ({word_count} words) "
+                    "copied to clipboard."
+                )
         except pyperclip.PyperclipException:
-            click.echo("⚠️  Could not access the clipboard; printing instead:\n")
-            click.echo(text)
+            # The import-time probe can still go stale (X session gone,
+            # Wayland socket closed), so keep the runtime fallback.
+            _print_clipboard_fallback(text)
+    elif copy:
+        # Known-absent clipboard: skip pyperclip's doomed subprocess probe
+        # and go straight to printing.
+        _print_clipboard_fallback(text)
     else:
-        click.echo(text)
+        # Encode once and write raw bytes: skips the text wrapper's own
+        # encoding pass over a potentially multi-megabyte payload.  Some
+        # replaced stdouts (capture harnesses, odd pipes) have no .buffer,
+        # so keep the text-stream write as the fallback.
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            buffer.write(text.encode("utf-8"))
+            buffer.write(b"\n")
+            buffer.flush()
+        else:
+            out = click.get_text_stream("stdout")
+            out.write(text)
+            out.write("\n")
 
 
 if __name__ == "__main__":